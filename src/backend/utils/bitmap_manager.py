@@ -1,14 +1,21 @@
 """
 Bitmap management utilities for LCD rendering.
 
-Provides serialization to .lcd_bitmap JSON files.
+Provides serialization to .lcd_bitmap JSON files. The decoded glyph masks
+are cached in a .npz file next to the font, which is rebuilt whenever the
+font file is newer.
 """
 
 from __future__ import annotations
 
-import json
+import os
+import tempfile
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from src.backend.utils.json_io import read_json
 
 RESOURCE_DIR = Path(__file__).resolve().parents[2] / "resources"
 DEFAULT_FONT_PATH = RESOURCE_DIR / "bitmap.lcd_bitmap"
@@ -17,13 +24,83 @@ DEFAULT_FONT_PATH = RESOURCE_DIR / "bitmap.lcd_bitmap"
 def load_font_map(
     path: str | Path = DEFAULT_FONT_PATH,
 ) -> Dict[str, List[str]]:
-    file_path = Path(path)
-    data = json.loads(file_path.read_text(encoding="utf-8"))
+    data = read_json(path)
     font_data = data.get("font_5x8") or data.get("font") or data
     return {str(k): list(v) for k, v in font_data.items()}
 
 
-BITMAP = load_font_map()
+def glyph_to_mask(rows: Sequence[str]) -> np.ndarray:
+    """
+    Decode a glyph given as rows of "0"/"1" strings into a (8, 5) mask.
+
+    Missing rows or columns are left off, extra ones are ignored.
+    """
+    mask = np.zeros((8, 5), dtype=np.uint8)
+    for gy, row in enumerate(rows[:8]):
+        for gx, bit in enumerate(row[:5]):
+            mask[gy, gx] = bit == "1"
+    return mask
+
+
+def mask_to_glyph(mask: np.ndarray) -> List[str]:
+    """
+    Encode a (8, 5) mask back into rows of "0"/"1" strings.
+    """
+    return ["".join("1" if bit else "0" for bit in row) for row in mask]
+
+
+def load_font_arrays(
+    path: str | Path = DEFAULT_FONT_PATH,
+) -> tuple[List[str], np.ndarray]:
+    """
+    Load the characters of a font and their stacked (N, 8, 5) masks.
+
+    Uses the .npz cache next to the font file if it is up to date,
+    otherwise parses the font and rewrites the cache.
+
+    Args:
+        path:
+            The .lcd_bitmap font file.
+
+    Returns:
+        List[str]: The characters, in font order.
+        np.ndarray: The glyph mask of every character.
+    """
+    font_path = Path(path)
+    cache_path = font_path.with_suffix(".npz")
+    try:
+        if cache_path.stat().st_mtime >= font_path.stat().st_mtime:
+            with np.load(cache_path) as cached:
+                return cached["chars"].tolist(), cached["masks"]
+    except Exception:
+        # A missing, truncated or otherwise unreadable cache is rebuilt
+        pass
+
+    font_map = load_font_map(font_path)
+    chars = list(font_map)
+    masks = np.stack([glyph_to_mask(rows) for rows in font_map.values()])
+    try:
+        # Write to a temporary file and swap it in, so an interrupted
+        # write never leaves a broken cache behind
+        fd, tmp_name = tempfile.mkstemp(suffix=".npz", dir=cache_path.parent)
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                np.savez(tmp, chars=np.array(chars), masks=masks)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        # A read-only install just parses the font every time
+        pass
+    return chars, masks
+
+
+_chars, BITMAP_ARRAY = load_font_arrays()
+BITMAP_INDEX: Dict[str, int] = {ch: i for i, ch in enumerate(_chars)}
+BITMAP: Dict[str, List[str]] = {
+    ch: mask_to_glyph(mask) for ch, mask in zip(_chars, BITMAP_ARRAY)
+}
 
 
 def get_bitmap_keys() -> List[str]:
@@ -12,11 +12,32 @@ Last Modified:
 
 from __future__ import annotations
 
+import io
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable, List
 
-from src.backend.utils.bitmap_manager import BITMAP
+import numpy as np
+
+from src.backend.utils.bitmap_manager import (
+    BITMAP,
+    BITMAP_ARRAY,
+    BITMAP_INDEX,
+    glyph_to_mask,
+)
+
+# A backslash, optionally followed by the number of a custom char
+_ESCAPE_RE = re.compile(r"\\(\d+)?")
+_HEADER_TEMPLATE = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="100%" height="100%" '
+    'viewBox="0 0 {w} {h}">'
+    '<rect x="0" y="0" width="{w}" height="{h}" rx="0" fill="{frame}"/>'
+    '<rect x="{frame_width}" y="{frame_width}" width="{inner_w}" '
+    'height="{inner_h}" rx="{inner_rx}" fill="{background}"/>'
+)
+_SPACE_INDEX = BITMAP_INDEX[" "]
+_BACKSLASH_INDEX = BITMAP_INDEX["\\"]
 
 
 @dataclass(frozen=True)
@@ -52,87 +73,98 @@ class CustomStyle(LCDStyle):
     pixel_off: str = "#cde543"
 
 
-def _glyph_for(
-    row: str,
-    col_start: int,
-    custom_chars: dict[int, List[str]] | None = None,
-) -> tuple[List[str], str]:
-    custom_chars = custom_chars or {}
-    if row[col_start] != "\\":
-        return (
-            BITMAP.get(row[col_start], BITMAP[" "]),
-            row,
-        )
-    else:
-        # Handle backslash escape for custom chars
-        escape_sequence, next_col_start = _get_text_till_next_non_numeric(
-            row, col_start + 1
-        )
-        if escape_sequence == "":
-            # Just a backslash, render as normal character
-            return (
-                BITMAP["\\"],
-                row[:col_start]
-                + row[next_col_start:]
-                + " " * (next_col_start - col_start),
-            )
-        elif re.fullmatch(r"\d+", escape_sequence):
-            char_code = int(escape_sequence)
-            return (
-                custom_chars.get(char_code, BITMAP[" "]),
-                row[:col_start]
-                + row[next_col_start:]
-                + " " * (next_col_start - col_start),
-            )
-
-        return BITMAP[" "], row
-
-
-def _get_text_till_next_non_numeric(
-    string: str, start: int
-) -> tuple[str, int]:
+def _preparse_row(
+    row: str, cols: int, custom_index: dict[int, int]
+) -> List[int]:
     """
-    Get substring from start index till next non-numeric character.
-    If no non-numeric character is found, return the rest of the string.
+    Map a line of text to the glyph indices of its cells in one pass.
+
+    "\\N" takes a single cell showing custom char N, a backslash that is
+    not followed by a number is shown as a backslash.
 
     Args:
-        string:
-            The string to search
-        start:
-            The index to start seachring at.
+        row:
+            The line of text.
+        cols:
+            The number of cells; further text is cut off.
+        custom_index:
+            The glyph index of every available custom char number.
 
     Returns:
-        str:
-            The found string or empty string
-        int:
-            The index of the next character after the found string
+        List[int]: The glyph index of every cell, at most cols long.
     """
-    end = start
-    while end < len(string) and string[end].isnumeric():
-        end += 1
+    glyph_index = BITMAP_INDEX.get
+    codes: List[int] = []
+    pos = 0
+    for match in _ESCAPE_RE.finditer(row):
+        start = match.start()
+        codes.extend(glyph_index(ch, _SPACE_INDEX) for ch in row[pos:start])
+        if len(codes) >= cols:
+            return codes[:cols]
+        number = match.group(1)
+        codes.append(
+            _BACKSLASH_INDEX
+            if number is None
+            else custom_index.get(int(number), _SPACE_INDEX)
+        )
+        pos = match.end()
+    end = pos + cols - len(codes)
+    codes.extend(glyph_index(ch, _SPACE_INDEX) for ch in row[pos:end])
+    return codes
 
-    return string[start:end], end - 1
 
+@lru_cache(maxsize=1024)
+def _glyph_template(style: LCDStyle, mask: bytes) -> tuple[str, str]:
+    """
+    Build the SVG path data of a single glyph, relative to its cell origin.
 
-def generate_lcd_svg(
-    rows: int,
-    cols: int,
-    lines: Iterable[str],
-    style: LCDStyle = CustomStyle(),
-    custom_chars: dict[int, List[str]] | None = None,
-) -> str:
-    """Generate SVG for an HD44780-like LCD (5x8 font).
+    Every pixel is a subpath of the form "m dx dy h px v px h -px z". The
+    moves are relative to the previous pixel, so the data only has to be
+    prefixed with an absolute "M x0 y0" to place the glyph.
 
-    rows: number of display rows (e.g., 2, 4)
-    cols: number of characters per row (e.g., 16, 20)
-    lines: iterable of strings; will be padded/truncated to rows/cols
+    Args:
+        style:
+            The style providing pixel size and gap.
+        mask:
+            The (8, 5) uint8 glyph mask as bytes.
+
+    Returns:
+        str: The path data of the OFF pixels.
+        str: The path data of the ON pixels.
+    """
+    px = style.pixel_size
+    step = px + style.pixel_gap
+    subpaths: tuple[list[str], list[str]] = ([], [])
+    last = [(0, 0), (0, 0)]
+    # The mask is row-major, so byte i is pixel (i // 5, i % 5)
+    for i, bit in enumerate(mask):
+        gy, gx = divmod(i, 5)
+        x, y = gx * step, gy * step
+        last_x, last_y = last[bit]
+        subpaths[bit].append(f"m{x - last_x} {y - last_y}h{px}v{px}h-{px}z")
+        last[bit] = (x, y)
+    return "".join(subpaths[0]), "".join(subpaths[1])
+
+
+@lru_cache(maxsize=16)
+def _geometry(
+    style: LCDStyle, rows: int, cols: int
+) -> tuple[int, int, int, int, str]:
     """
-    # Normalize text
-    text_lines = [line.ljust(cols) for line in list(lines)]
-    while len(text_lines) < rows:
-        text_lines.append(" " * cols)
+    Compute the layout of a display and its SVG header.
+
+    Args:
+        style:
+            The style of the display.
+        rows:
+            The number of display rows.
+        cols:
+            The number of characters per row.
 
-    # Compute geometry
+    Returns:
+        tuple: The character width and height, the x and y origin of the
+        first character and the SVG header including frame and background.
+    """
     px = style.pixel_size
     gap = style.pixel_gap
     char_w = 5 * px + 4 * gap
@@ -149,44 +181,103 @@ def generate_lcd_svg(
         + (rows - 1) * style.row_gap
         + style.frame_width * 2
     )
-
-    # SVG header
-    parts = [
-        f'<svg xmlns="http://www.w3.org/2000/svg" width="100%" height="100%" '
-        f'viewBox="0 0 {w} {h}">',
-        f'<rect x="0" y="0" width="{w}" height="{h}" rx="0" '
-        f'fill="{style.frame}"/>',
-        f'<rect x="{style.frame_width}" y="{style.frame_width}" '
-        f'width="{w - 2 * style.frame_width}" ',
-        f'height="{h - 2 * style.frame_width}" '
-        f'rx="{max(style.border_radius - 4, 0)}" fill="{style.background}"/>',
-    ]
-
-    # Render pixels
     origin_x = style.frame_width + style.padding
     origin_y = style.frame_width + style.padding
 
+    header = _HEADER_TEMPLATE.format(
+        w=w,
+        h=h,
+        frame=style.frame,
+        frame_width=style.frame_width,
+        inner_w=w - 2 * style.frame_width,
+        inner_h=h - 2 * style.frame_width,
+        inner_rx=max(style.border_radius - 4, 0),
+        background=style.background,
+    )
+    return char_w, char_h, origin_x, origin_y, header
+
+
+def generate_lcd_svg(
+    rows: int,
+    cols: int,
+    lines: Iterable[str],
+    style: LCDStyle = CustomStyle(),
+    custom_chars: dict[int, List[str]] | None = None,
+) -> str:
+    """Generate SVG for an HD44780-like LCD (5x8 font).
+
+    rows: number of display rows (e.g., 2, 4)
+    cols: number of characters per row (e.g., 16, 20)
+    lines: iterable of strings; will be padded/truncated to rows/cols
+
+    Results are cached, so rendering the same content again is a lookup.
+    """
+    custom_key = tuple(
+        sorted(
+            (code, tuple(pattern))
+            for code, pattern in (custom_chars or {}).items()
+        )
+    )
+    return _generate_lcd_svg_cached(
+        rows, cols, tuple(lines), style, custom_key
+    )
+
+
+@lru_cache(maxsize=64)
+def _generate_lcd_svg_cached(
+    rows: int,
+    cols: int,
+    lines: tuple[str, ...],
+    style: LCDStyle,
+    custom_chars: tuple[tuple[int, tuple[str, ...]], ...],
+) -> str:
+    # The spinboxes accept typed negative sizes; draw an empty panel then
+    rows, cols = max(rows, 0), max(cols, 0)
+    char_w, char_h, origin_x, origin_y, header = _geometry(style, rows, cols)
+    svg = io.StringIO()
+    svg.write(header)
+
+    # Map every cell to a glyph index; custom chars follow the font glyphs.
+    # Cells without text keep the space glyph.
+    custom_codes = [code for code, _ in custom_chars]
+    custom_index = {
+        code: len(BITMAP_ARRAY) + i for i, code in enumerate(custom_codes)
+    }
+    bitmaps = BITMAP_ARRAY
+    if custom_codes:
+        bitmaps = np.concatenate(
+            [
+                BITMAP_ARRAY,
+                np.stack([glyph_to_mask(p) for _, p in custom_chars]),
+            ]
+        )
+    text_codes = np.full((rows, cols), _SPACE_INDEX, dtype=np.int32)
+    for r, line in enumerate(lines[:rows]):
+        codes = _preparse_row(line, cols, custom_index)
+        text_codes[r, : len(codes)] = codes
+
+    off_path = io.StringIO()
+    on_path = io.StringIO()
     for r in range(rows):
         y0 = origin_y + r * (char_h + style.row_gap)
         for c in range(cols):
             x0 = origin_x + c * (char_w + style.char_gap)
-            glyph, new_line = _glyph_for(
-                text_lines[r], c, custom_chars=custom_chars
+            off_d, on_d = _glyph_template(
+                style, bitmaps[text_codes[r, c]].tobytes()
             )
-            text_lines[r] = new_line
-            for gy, row in enumerate(glyph):
-                for gx, bit in enumerate(row):
-                    fill = style.pixel_on if bit == "1" else style.pixel_off
-                    px_x = x0 + gx * (px + gap)
-                    px_y = y0 + gy * (px + gap)
-                    parts.append(
-                        f'<rect x="{px_x}" y="{px_y}" width="{px}" '
-                        f'height="{px}" '
-                        f'fill="{fill}"/>'
-                    )
-
-    parts.append("</svg>")
-    return "\n".join(parts)
+            if off_d:
+                off_path.write(f"M{x0} {y0}")
+                off_path.write(off_d)
+            if on_d:
+                on_path.write(f"M{x0} {y0}")
+                on_path.write(on_d)
+
+    svg.write(f'<path fill="{style.pixel_off}" d="')
+    svg.write(off_path.getvalue())
+    svg.write(f'"/><path fill="{style.pixel_on}" d="')
+    svg.write(on_path.getvalue())
+    svg.write('"/></svg>')
+    return svg.getvalue()
 
 
 def save_svg(path: str, svg_content: str) -> bool:
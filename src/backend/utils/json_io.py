@@ -0,0 +1,45 @@
+"""
+JSON file helpers for LCD resources, settings and projects.
+
+Uses orjson when it is installed and falls back to the json module.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def read_json(path: str | Path) -> Any:
+    """
+    Read and parse a JSON file.
+
+    The file is parsed from bytes, so no separate UTF-8 decode is needed.
+    """
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(path: str | Path, payload: Any) -> None:
+    """
+    Write payload as indented JSON.
+
+    Non-string dict keys (e.g. custom char codes) are written as strings,
+    as the json module does.
+    """
+    if orjson is not None:
+        Path(path).write_bytes(
+            orjson.dumps(
+                payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        )
+        return
+    Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
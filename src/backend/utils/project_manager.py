@@ -7,25 +7,28 @@ and multiple text inputs.
 
 from __future__ import annotations
 
-import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List
 
-from src.backend.utils.settings_manager import LCDSettings, dict_to_settings
-
-
-@dataclass
-class LCDInput:
-    name: str
-    text: str
+from src.backend.utils.json_io import read_json, write_json
+from src.backend.utils.settings_manager import (
+    LCDSettings,
+    dict_to_settings,
+    style_to_dict,
+)
 
 
 @dataclass
 class LCDProject:
+    """
+    An LCD project. Inputs are stored as parallel name and text lists.
+    """
+
     settings: LCDSettings
     custom_chars: Dict[int, List[str]]
-    inputs: List[LCDInput]
+    input_names: List[str]
+    input_texts: List[str]
     active_input: int = 0
 
 
@@ -34,10 +37,13 @@ def project_to_dict(project: LCDProject) -> dict[str, Any]:
         "settings": {
             "rows": project.settings.rows,
             "cols": project.settings.cols,
-            "style": asdict(project.settings.style),
+            "style": style_to_dict(project.settings.style),
         },
         "custom_chars": project.custom_chars,
-        "inputs": [asdict(item) for item in project.inputs],
+        "inputs": [
+            {"name": name, "text": text}
+            for name, text in zip(project.input_names, project.input_texts)
+        ],
         "active_input": project.active_input,
     }
 
@@ -48,15 +54,18 @@ def dict_to_project(data: dict[str, Any]) -> LCDProject:
         int(k): v for k, v in (data.get("custom_chars", {}) or {}).items()
     }
     inputs_data = data.get("inputs", []) or []
-    inputs = [LCDInput(**item) for item in inputs_data]
-    if not inputs:
-        inputs = [LCDInput(name="Input 1", text="")]
+    input_names = [item["name"] for item in inputs_data]
+    input_texts = [item["text"] for item in inputs_data]
+    if not input_names:
+        input_names = ["Input 1"]
+        input_texts = [""]
     active_input = int(data.get("active_input", 0))
-    active_input = max(0, min(active_input, len(inputs) - 1))
+    active_input = max(0, min(active_input, len(input_names) - 1))
     return LCDProject(
         settings=settings,
         custom_chars=custom_chars,
-        inputs=inputs,
+        input_names=input_names,
+        input_texts=input_texts,
         active_input=active_input,
     )
 
@@ -67,11 +76,10 @@ def save_project(path: str | Path, project: LCDProject) -> Path:
         file_path = file_path.with_suffix(".lcd_project")
 
     payload = project_to_dict(project)
-    file_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    write_json(file_path, payload)
     return file_path
 
 
 def load_project(path: str | Path) -> LCDProject:
-    file_path = Path(path)
-    data = json.loads(file_path.read_text(encoding="utf-8"))
+    data = read_json(path)
     return dict_to_project(data)
@@ -6,12 +6,12 @@ Provides serialization to .lcd_settings JSON files.
 
 from __future__ import annotations
 
-import json
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
 from src.backend.utils.generate_svg import CustomStyle, LCDStyle
+from src.backend.utils.json_io import read_json, write_json
 
 
 @dataclass(frozen=True)
@@ -21,12 +21,22 @@ class LCDSettings:
     style: LCDStyle = field(default_factory=CustomStyle)
 
 
+_STYLE_FIELDS = tuple(f.name for f in fields(LCDStyle))
+
+
+def style_to_dict(style: LCDStyle) -> dict[str, Any]:
+    """
+    Convert a style to a dict without the recursive copy of asdict().
+    """
+    return {name: getattr(style, name) for name in _STYLE_FIELDS}
+
+
 def settings_to_dict(settings: LCDSettings) -> dict[str, Any]:
     return {
         "schema": "lcd_settings_v1",
         "rows": settings.rows,
         "cols": settings.cols,
-        "style": asdict(settings.style),
+        "style": style_to_dict(settings.style),
     }
 
 
@@ -49,7 +59,7 @@ def save_settings(path: str | Path, settings: LCDSettings) -> Path:
         file_path = file_path.with_suffix(".lcd_settings")
 
     payload = settings_to_dict(settings)
-    file_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    write_json(file_path, payload)
     return file_path
 
 
@@ -57,6 +67,5 @@ def load_settings(path: str | Path) -> LCDSettings:
     """
     Load settings from a .lcd_settings JSON file.
     """
-    file_path = Path(path)
-    data = json.loads(file_path.read_text(encoding="utf-8"))
+    data = read_json(path)
     return dict_to_settings(data)
@@ -4,30 +4,228 @@ GUI for LCD SVG rendering with debounce updates.
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import io
 import json
+import re
+import time
 import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import fields
 from pathlib import Path
-from tkinter import filedialog, messagebox, simpledialog
-from typing import Any, Optional
+from tkinter import commondialog, filedialog, messagebox, simpledialog
+from typing import Any, Callable, Optional
 
-import cairosvg
 import ttkbootstrap as ttk
+from cairosvg.parser import Tree
+from cairosvg.surface import PNGSurface
 from PIL import Image, ImageOps, ImageTk
 from ttkbootstrap.constants import BOTH, LEFT, RIGHT, X
 from ttkbootstrap.widgets.scrolled import ScrolledText
 
 from src.backend.utils.generate_svg import LCDStyle, generate_lcd_svg
+from src.backend.utils.json_io import read_json
 from src.backend.utils.project_manager import (
-    LCDInput,
     LCDProject,
     load_project,
     save_project,
 )
-from src.backend.utils.settings_manager import LCDSettings, load_settings
+from src.backend.utils.settings_manager import (
+    LCDSettings,
+    load_settings,
+    save_settings,
+)
+
+try:
+    import resvg_py
+except ImportError:
+    resvg_py = None
 
 RESOURCE_DIR = Path(__file__).resolve().parents[2] / "resources"
 PRESETS_PATH = RESOURCE_DIR / "presets.json"
+PREVIEW_CACHE_SIZE = 8
+RENDER_DELAY_MS = 300
+RENDER_DELAY_TYPING_MS = 700
+RENDER_DELAY_ACTION_MS = 50
+TEXT_INSERT_CHUNK = 1 << 16
+CUSTOM_CHAR_CELL = 18
+CUSTOM_CHAR_PITCH = CUSTOM_CHAR_CELL + 4
+_STYLE_FIELDS = tuple(f.name for f in fields(LCDStyle))
+_COLOR_FIELDS = ("background", "frame", "pixel_on", "pixel_off")
+_ROW_LUT = {f"{i:05b}": i for i in range(32)}
+_VIEWBOX_RE = re.compile(rb'viewBox="0 0 (\d+) (\d+)"')
+_DEFAULT_PRESETS: tuple[dict[str, Any], ...] = (
+    {
+        "name": "Yellow LCD",
+        "settings": {
+            "rows": 4,
+            "cols": 20,
+            "style": {
+                "background": "#d8f245",
+                "frame": "#000000",
+                "pixel_on": "#141f14",
+                "pixel_off": "#cde543",
+                "border_radius": 12,
+                "padding": 16,
+                "pixel_size": 3,
+                "pixel_gap": 1,
+                "char_gap": 4,
+                "row_gap": 10,
+                "frame_width": 8,
+            },
+        },
+    },
+)
+
+
+def _fit_size(
+    svg_size: tuple[int, int], width: int, height: int
+) -> tuple[int, int]:
+    """
+    Return the largest size with the SVG's aspect ratio that fits into
+    width x height, rounded the same way as ImageOps.contain.
+    """
+    svg_w, svg_h = svg_size
+    if svg_w * height > svg_h * width:
+        return width, max(round(svg_h * width / svg_w), 1)
+    return max(round(svg_w * height / svg_h), 1), height
+
+
+def _svg_to_image(svg: bytes, width: int, height: int) -> Image.Image:
+    """
+    Render an SVG to an RGBA image of the given size.
+
+    Uses resvg when it is installed. Otherwise cairosvg renders into an
+    in-memory surface that is wrapped directly, without a PNG round-trip.
+    """
+    if resvg_py is not None:
+        png_bytes = bytes(
+            resvg_py.svg_to_bytes(
+                svg_string=svg.decode("utf-8"), width=width, height=height
+            )
+        )
+        image = Image.open(io.BytesIO(png_bytes))
+        image.load()
+        return image
+    surface = PNGSurface(
+        Tree(bytestring=svg),
+        None,
+        96,
+        output_width=width,
+        output_height=height,
+    )
+    cairo_surface = surface.cairo
+    cairo_surface.flush()
+    # Cairo stores premultiplied ARGB32 in native (little-endian) order
+    image = Image.frombytes(
+        "RGBA",
+        (cairo_surface.get_width(), cairo_surface.get_height()),
+        bytes(cairo_surface.get_data()),
+        "raw",
+        "BGRa",
+        cairo_surface.get_stride(),
+    )
+    surface.finish()
+    return image
+
+
+def _rasterize_preview(
+    svg: bytes,
+    base: Optional[Image.Image],
+    size: tuple[int, int],
+) -> tuple[Image.Image, Image.Image]:
+    """
+    Rasterize an SVG for the preview at size, which must already have the
+    SVG's aspect ratio.
+
+    Runs in the raster worker thread, so it must not touch any Tk object.
+    The SVG is only rendered if no cached base image is given; otherwise
+    the larger base image is scaled down.
+    """
+    if base is None:
+        base = _svg_to_image(svg, *size)
+    if base.size == size:
+        return base, base
+    image = ImageOps.contain(base, size, method=Image.LANCZOS)
+    return base, image
+
+
+def _settings_fingerprint(settings: LCDSettings) -> tuple:
+    style = settings.style
+    return (
+        settings.rows,
+        settings.cols,
+        *(getattr(style, name) for name in _STYLE_FIELDS),
+    )
+
+
+def _project_fingerprint(project: LCDProject) -> tuple:
+    # Tuples of the existing objects: cheap to build, and unchanged strings
+    # compare by identity
+    return (
+        project.settings,
+        tuple(project.input_names),
+        tuple(project.input_texts),
+        project.active_input,
+        tuple(
+            sorted(
+                (code, tuple(pattern))
+                for code, pattern in project.custom_chars.items()
+            )
+        ),
+    )
+
+
+def _has_astral(text: str) -> bool:
+    return bool(text) and max(text) > "\uffff"
+
+
+def _changed_span(old: str, new: str) -> tuple[int, int]:
+    """
+    Return the lengths of the common prefix and the non-overlapping common
+    suffix of two strings.
+    """
+    limit = min(len(old), len(new))
+    prefix = 0
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    limit -= prefix
+    suffix = 0
+    while suffix < limit and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix
+
+
+def _custom_char_bit(row: int, col: int) -> int:
+    return 1 << (row * 5 + 4 - col)
+
+
+def _custom_char_row_bits(row: str) -> int:
+    bits = _ROW_LUT.get(row[:5])
+    if bits is not None:
+        return bits
+    # Short or malformed rows: anything but "1" is an unset pixel
+    bits = 0
+    for c, bit in enumerate(row[:5]):
+        if bit == "1":
+            bits |= 1 << (4 - c)
+    return bits
+
+
+def _cache_get(cache: OrderedDict, key: Any) -> Any:
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache: OrderedDict, key: Any, value: Any) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > PREVIEW_CACHE_SIZE:
+        cache.popitem(last=False)
 
 
 class LCDApp(ttk.Window):
@@ -36,49 +234,123 @@ class LCDApp(ttk.Window):
         self.title("LCD Screenshot Generator")
         self.geometry("900x600")
 
+        self._presets: list[dict[str, Any]] = []
+        self._preset_settings: list[Optional[LCDSettings]] = []
+        self._presets_mtime: Optional[int] = None
+        self._presets_loaded = False
+        self._refresh_presets()
+
         self.project = self._load_initial_project()
+        self._settings_version = 0
         self.settings = self.project.settings
         self._render_job: Optional[str] = None
+        self._resize_job: Optional[str] = None
+        self._last_keystroke_ts = 0.0
         self._image_ref: Optional[ImageTk.PhotoImage] = None
-        self._last_svg: Optional[str] = None
+        self._last_svg_bytes: Optional[bytes] = None
+        self._last_svg_hash: Optional[str] = None
+        self._last_render_key: Optional[tuple] = None
+        self._svg_cache: OrderedDict[
+            tuple, tuple[bytes, str, tuple[int, int]]
+        ] = OrderedDict()
+        self._raster_cache: OrderedDict[str, Image.Image] = OrderedDict()
+        self._last_svg_size = (1, 1)
+        self._preview_cache: OrderedDict[tuple[str, int, int], Image.Image] = (
+            OrderedDict()
+        )
+        self._last_preview_key: Optional[tuple[str, int, int]] = None
+        self._raster_pool = ThreadPoolExecutor(max_workers=1)
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._raster_future: Optional[Future] = None
+        self._raster_future_key: Optional[tuple[str, int, int]] = None
+        self._raster_poll_job: Optional[str] = None
         self._settings_window: Optional[tk.Toplevel] = None
         self._custom_chars_window: Optional[tk.Toplevel] = None
         self._suppress_text_events = False
-        self._presets: list[dict[str, Any]] = []
+        self._rename_entry: Optional[ttk.Entry] = None
+        # Reused so each dialog reopens in the directory last picked in it
+        self._file_dialogs: dict[str, commondialog.Dialog] = {
+            "load_settings": filedialog.Open(
+                self,
+                title="Load Settings",
+                filetypes=[("LCD Settings", "*.lcd_settings")],
+            ),
+            "save_settings": filedialog.SaveAs(
+                self,
+                title="Save Settings",
+                defaultextension=".lcd_settings",
+                filetypes=[("LCD Settings", "*.lcd_settings")],
+            ),
+            "load_project": filedialog.Open(
+                self,
+                title="Load Project",
+                filetypes=[("LCD Project", "*.lcd_project")],
+            ),
+            "save_project": filedialog.SaveAs(
+                self,
+                title="Save Project",
+                defaultextension=".lcd_project",
+                filetypes=[("LCD Project", "*.lcd_project")],
+            ),
+            "save_svg": filedialog.SaveAs(
+                self,
+                title="Save SVG",
+                defaultextension=".svg",
+                filetypes=[("SVG", "*.svg")],
+            ),
+        }
+        self._saved_project_state: Optional[tuple[Path, tuple]] = None
+        self._selector_state: Optional[tuple[tuple[str, ...], int]] = None
         self._preset_choice = tk.StringVar(value="custom")
         self._settings_controls: list[tk.Widget] = []
         self._settings_scroll_widgets: list[tk.Widget] = []
         self._applying_preset = False
+        self._suppress_settings_trace = False
         self._custom_char_number = tk.IntVar(value=0)
         self._custom_char_selector: Optional[ttk.Combobox] = None
-        self._custom_char_buttons: list[list[tk.Button]] = []
+        self._custom_char_canvas: Optional[tk.Canvas] = None
+        self._custom_char_rects: list[list[int]] = []
         self._custom_char_bg_frame: Optional[ttk.Frame] = None
-        self._custom_char_grid_frame: Optional[ttk.Frame] = None
         self._custom_char_bg_style = "CustomCharBg.TFrame"
-        self._custom_char_grid_style = "CustomCharGrid.TFrame"
-        self._custom_char_bits: list[list[int]] = [
-            [0 for _ in range(5)] for _ in range(8)
-        ]
+        # 40-bit mask, bit (row * 5 + 4 - col) is pixel (row, col)
+        self._custom_char_mask = 0
+        self._pending_custom_char_paint = False
+        self._custom_char_colors = (
+            self.settings.style.pixel_on,
+            self.settings.style.pixel_off,
+        )
         self._custom_char_updating = False
         self._init_settings_vars()
 
         self._build_ui()
         self._schedule_render()
+        self.after_idle(self._warm_dialogs)
+
+    @property
+    def settings(self) -> LCDSettings:
+        return self._settings
+
+    @settings.setter
+    def settings(self, value: LCDSettings) -> None:
+        # Bumped on every assignment, so renders can check it in O(1)
+        self._settings = value
+        self._settings_version += 1
+
+    def _warm_dialogs(self) -> None:
+        # On X11, Tk's file dialog and message box are Tcl scripts sourced on
+        # first use; load them now so the first dialog opens without a stall.
+        # Elsewhere they are native and there is nothing to preload.
+        if self.tk.call("tk", "windowingsystem") != "x11":
+            return
+        for command in ("::tk::dialog::file::", "::tk::MessageBox"):
+            try:
+                self.tk.call("auto_load", command)
+            except tk.TclError:
+                pass
 
     def _load_initial_settings(self) -> LCDSettings:
-        presets = self._load_presets()
-        if presets:
-            preset = presets[0]
-            settings_data = preset.get("settings", {})
-            style_data = settings_data.get("style", {})
-            try:
-                return LCDSettings(
-                    rows=int(settings_data.get("rows", 4)),
-                    cols=int(settings_data.get("cols", 20)),
-                    style=LCDStyle(**style_data),
-                )
-            except (ValueError, tk.TclError):
-                return LCDSettings()
+        if self._preset_settings and self._preset_settings[0] is not None:
+            return self._preset_settings[0]
         return LCDSettings()
 
     def _load_initial_project(self) -> LCDProject:
@@ -86,7 +358,8 @@ class LCDApp(ttk.Window):
         return LCDProject(
             settings=settings,
             custom_chars={},
-            inputs=[LCDInput(name="Input 1", text="")],
+            input_names=["Input 1"],
+            input_texts=[""],
             active_input=0,
         )
 
@@ -234,7 +507,7 @@ class LCDApp(ttk.Window):
             lambda: (_unbind_mousewheel(), window.destroy()),
         )
 
-        self._presets = self._load_presets()
+        self._refresh_presets()
         preset_frame = ttk.Labelframe(scroll_frame, text="Preset")
         preset_frame.pack(fill=X, expand=False, pady=(0, 8))
         self._build_preset_radios(preset_frame)
@@ -276,7 +549,8 @@ class LCDApp(ttk.Window):
         window.resizable(True, True)
 
         def on_close() -> None:
-            self._custom_char_buttons = []
+            self._custom_char_canvas = None
+            self._custom_char_rects = []
             self._custom_char_selector = None
             window.destroy()
 
@@ -291,9 +565,7 @@ class LCDApp(ttk.Window):
 
         button_row = ttk.Frame(container)
         button_row.pack(fill=X, pady=(10, 0))
-        ttk.Button(button_row, text="Close", command=window.destroy).pack(
-            side=RIGHT
-        )
+        ttk.Button(button_row, text="Close", command=on_close).pack(side=RIGHT)
 
         self._custom_chars_window = window
 
@@ -403,76 +675,118 @@ class LCDApp(ttk.Window):
         )
         self._custom_char_bg_frame.pack(padx=6, pady=6)
 
-        self._custom_char_grid_frame = ttk.Frame(
+        # One canvas with 40 rectangles instead of 40 button widgets
+        canvas = tk.Canvas(
             self._custom_char_bg_frame,
-            style=self._custom_char_grid_style,
+            width=5 * CUSTOM_CHAR_PITCH,
+            height=8 * CUSTOM_CHAR_PITCH,
+            background=self.settings.style.background,
+            borderwidth=0,
+            highlightthickness=0,
         )
-        self._custom_char_grid_frame.pack(padx=8, pady=8)
-
-        self._custom_char_buttons = []
+        canvas.pack(padx=8, pady=8)
+        canvas.bind("<Button-1>", self._on_custom_char_click)
+        offset = (CUSTOM_CHAR_PITCH - CUSTOM_CHAR_CELL) // 2
+        self._custom_char_rects = []
         for r in range(8):
-            row_buttons: list[tk.Button] = []
-            for c in range(5):
-                btn = tk.Button(
-                    self._custom_char_grid_frame,
-                    width=2,
-                    height=1,
-                    command=lambda rr=r, cc=c: self._toggle_custom_char(
-                        rr, cc
-                    ),
-                    borderwidth=0,
-                    highlightthickness=0,
-                    padx=0,
-                    pady=0,
-                )
-                btn.grid(row=r, column=c, padx=2, pady=2)
-                row_buttons.append(btn)
-            self._custom_char_buttons.append(row_buttons)
+            y0 = r * CUSTOM_CHAR_PITCH + offset
+            self._custom_char_rects.append(
+                [
+                    canvas.create_rectangle(
+                        c * CUSTOM_CHAR_PITCH + offset,
+                        y0,
+                        c * CUSTOM_CHAR_PITCH + offset + CUSTOM_CHAR_CELL,
+                        y0 + CUSTOM_CHAR_CELL,
+                    )
+                    for c in range(5)
+                ]
+            )
+        self._custom_char_canvas = canvas
 
         self._refresh_custom_char_selector()
 
     def _on_text_change(self, _event: Any = None) -> None:
+        now = time.monotonic()
+        typing_fast = now - self._last_keystroke_ts < 0.08
+        self._last_keystroke_ts = now
         self._update_active_input_text()
-        self._schedule_render()
+        # Wait longer while the user is typing fast, to skip mid-word renders
+        self._schedule_render(
+            RENDER_DELAY_TYPING_MS if typing_fast else RENDER_DELAY_MS
+        )
 
     def _on_text_modified(self, _event: Any = None) -> None:
+        if self._suppress_text_events:
+            return
         if self._text_widget.edit_modified():
             self._text_widget.edit_modified(False)
+            texts = self.project.input_texts
+            text = self._text_widget.get("1.0", "end-1c")
+            # Compare with the stored text, which programmatic loads keep
+            # in sync, so only real edits are stored and rendered
+            if texts and text == texts[self.project.active_input]:
+                return
             self._update_active_input_text()
             self._schedule_render()
 
     def _on_settings_change(self, *_args: Any) -> None:
-        if self._applying_preset:
+        if self._applying_preset or self._suppress_settings_trace:
+            return
+        if not self._apply_settings_from_ui():
             return
-        self._apply_settings_from_ui()
         self._preset_choice.set("custom")
         self._set_settings_controls_state(True)
         self._schedule_render()
 
-    def _apply_settings_from_ui(self) -> None:
+    def _apply_settings_from_ui(self) -> bool:
+        """
+        Update the settings from the UI variables.
+
+        Returns False if the values are invalid or unchanged.
+        """
+        style_vars = {
+            "background": self.var_bg,
+            "frame": self.var_frame,
+            "pixel_on": self.var_pixel_on,
+            "pixel_off": self.var_pixel_off,
+            "border_radius": self.var_border_radius,
+            "padding": self.var_padding,
+            "pixel_size": self.var_pixel_size,
+            "pixel_gap": self.var_pixel_gap,
+            "char_gap": self.var_char_gap,
+            "row_gap": self.var_row_gap,
+            "frame_width": self.var_frame_width,
+        }
         try:
-            style = LCDStyle(
-                background=self.var_bg.get(),
-                frame=self.var_frame.get(),
-                pixel_on=self.var_pixel_on.get(),
-                pixel_off=self.var_pixel_off.get(),
-                border_radius=int(self.var_border_radius.get()),
-                padding=int(self.var_padding.get()),
-                pixel_size=int(self.var_pixel_size.get()),
-                pixel_gap=int(self.var_pixel_gap.get()),
-                char_gap=int(self.var_char_gap.get()),
-                row_gap=int(self.var_row_gap.get()),
-                frame_width=int(self.var_frame_width.get()),
-            )
-            self.settings = LCDSettings(
-                rows=int(self.var_rows.get()),
-                cols=int(self.var_cols.get()),
-                style=style,
-            )
-            self.project.settings = self.settings
-            self._refresh_custom_char_grid_colors()
+            style_values = {
+                name: (
+                    style_vars[name].get()
+                    if name in _COLOR_FIELDS
+                    else int(style_vars[name].get())
+                )
+                for name in _STYLE_FIELDS
+            }
+            rows = int(self.var_rows.get())
+            cols = int(self.var_cols.get())
         except (ValueError, tk.TclError):
-            return
+            return False
+        old_style = self.settings.style
+        values = (rows, cols, *style_values.values())
+        if values == _settings_fingerprint(self.settings):
+            return False
+        self.settings = LCDSettings(
+            rows=rows,
+            cols=cols,
+            style=LCDStyle(**style_values),
+        )
+        self.project.settings = self.settings
+        # Only the colors are shown in the custom char editor
+        if any(
+            style_values[name] != getattr(old_style, name)
+            for name in _COLOR_FIELDS
+        ):
+            self._refresh_custom_char_grid_colors()
+        return True
 
     def _build_preset_radios(self, parent: ttk.Frame) -> None:
         for index, preset in enumerate(self._presets):
@@ -517,17 +831,11 @@ class LCDApp(ttk.Window):
         self._set_settings_controls_state(False)
         self._applying_preset = False
         self._refresh_custom_char_grid_colors()
-        self._schedule_render()
+        self._schedule_render(RENDER_DELAY_ACTION_MS)
 
     def _sync_preset_selection(self) -> None:
-        for index, preset in enumerate(self._presets):
-            settings_data = preset.get("settings", {})
-            style_data = settings_data.get("style", {})
-            if (
-                self.settings.rows == int(settings_data.get("rows", 4))
-                and self.settings.cols == int(settings_data.get("cols", 20))
-                and self.settings.style == LCDStyle(**style_data)
-            ):
+        for index, preset_settings in enumerate(self._preset_settings):
+            if self.settings == preset_settings:
                 self._preset_choice.set(f"preset:{index}")
                 self._set_settings_controls_state(False)
                 return
@@ -664,39 +972,62 @@ class LCDApp(ttk.Window):
 
     def _load_custom_char_bits(self, number: int) -> None:
         self._custom_char_updating = True
-        pattern = self.project.custom_chars.get(number)
-        if not pattern:
-            self._custom_char_bits = [[0 for _ in range(5)] for _ in range(8)]
-        else:
-            self._custom_char_bits = [
-                [1 if bit == "1" else 0 for bit in row[:5]]
-                for row in pattern[:8]
-            ]
-            while len(self._custom_char_bits) < 8:
-                self._custom_char_bits.append([0 for _ in range(5)])
+        pattern = self.project.custom_chars.get(number) or []
+        mask = 0
+        for r, row in enumerate(pattern[:8]):
+            mask |= _custom_char_row_bits(row) << (r * 5)
+        self._custom_char_mask = mask
 
         self._render_custom_char_grid()
         self._custom_char_updating = False
 
     def _render_custom_char_grid(self) -> None:
-        if not self._custom_char_buttons:
+        canvas = self._custom_char_canvas
+        if canvas is None:
             return
-        on_color = self.settings.style.pixel_on
-        off_color = self.settings.style.pixel_off
+        self._custom_char_colors = (
+            self.settings.style.pixel_on,
+            self.settings.style.pixel_off,
+        )
         border_color = self.settings.style.frame
-        for r in range(8):
-            for c in range(5):
-                color = on_color if self._custom_char_bits[r][c] else off_color
-                self._custom_char_buttons[r][c].configure(
-                    background=color,
-                    activebackground=color,
-                    highlightbackground=border_color,
-                    highlightthickness=1,
-                    relief="flat",
+        for r, row_rects in enumerate(self._custom_char_rects):
+            for c, rect in enumerate(row_rects):
+                canvas.itemconfigure(
+                    rect,
+                    fill=self._custom_char_cell_color(r, c),
+                    outline=border_color,
                 )
 
+    def _repaint_cell(self, row: int, col: int) -> None:
+        if self._custom_char_canvas is None:
+            return
+        self._custom_char_canvas.itemconfigure(
+            self._custom_char_rects[row][col],
+            fill=self._custom_char_cell_color(row, col),
+        )
+
+    def _on_custom_char_click(self, event: tk.Event) -> None:
+        self._toggle_custom_char(
+            event.y // CUSTOM_CHAR_PITCH, event.x // CUSTOM_CHAR_PITCH
+        )
+
+    def _custom_char_cell_color(self, row: int, col: int) -> str:
+        on_color, off_color = self._custom_char_colors
+        if self._custom_char_mask & _custom_char_bit(row, col):
+            return on_color
+        return off_color
+
     def _refresh_custom_char_grid_colors(self) -> None:
-        if not self._custom_char_buttons:
+        if self._custom_char_canvas is None or self._pending_custom_char_paint:
+            return
+        # Coalesce bursts of settings changes into one repaint per idle tick
+        self._pending_custom_char_paint = True
+        self.after_idle(self._flush_custom_char_paint)
+
+    def _flush_custom_char_paint(self) -> None:
+        self._pending_custom_char_paint = False
+        canvas = self._custom_char_canvas
+        if canvas is None or not canvas.winfo_exists():
             return
         self._configure_custom_char_styles()
         self._render_custom_char_grid()
@@ -707,81 +1038,144 @@ class LCDApp(ttk.Window):
             self._custom_char_bg_style,
             background=self.settings.style.background,
         )
-        style.configure(
-            self._custom_char_grid_style,
-            background=self.settings.style.background,
-        )
+        if self._custom_char_canvas is not None:
+            self._custom_char_canvas.configure(
+                background=self.settings.style.background
+            )
 
     def _toggle_custom_char(self, row: int, col: int) -> None:
         if row < 0 or row >= 8 or col < 0 or col >= 5:
             return
-        self._custom_char_bits[row][col] = (
-            0 if self._custom_char_bits[row][col] else 1
-        )
-        self._render_custom_char_grid()
+        self._custom_char_mask ^= _custom_char_bit(row, col)
+        self._repaint_cell(row, col)
         self._save_custom_char_bits()
-        self._schedule_render()
+        self._schedule_render(RENDER_DELAY_ACTION_MS)
 
     def _save_custom_char_bits(self) -> None:
         number = int(self._custom_char_number.get())
-        rows = [
-            "".join("1" if bit else "0" for bit in row)
-            for row in self._custom_char_bits
-        ]
-        if all(row == "00000" for row in rows):
+        if self._custom_char_mask == 0:
             self.project.custom_chars.pop(number, None)
             return
-        self.project.custom_chars[number] = rows
+        self.project.custom_chars[number] = [
+            f"{(self._custom_char_mask >> (r * 5)) & 0x1F:05b}"
+            for r in range(8)
+        ]
 
     def _clear_custom_char(self) -> None:
-        self._custom_char_bits = [[0 for _ in range(5)] for _ in range(8)]
+        self._custom_char_mask = 0
         self._render_custom_char_grid()
         self._save_custom_char_bits()
-        self._schedule_render()
+        self._schedule_render(RENDER_DELAY_ACTION_MS)
+
+    def _schedule_render(self, delay: int = RENDER_DELAY_MS) -> None:
+        """
+        Render after delay ms, replacing any render that is still pending.
 
-    def _schedule_render(self) -> None:
+        Discrete actions use a short delay, which is still enough to merge
+        the burst of variable traces and events they cause into one render.
+        """
         if self._render_job is not None:
             self.after_cancel(self._render_job)
-        self._render_job = self.after(500, self._render_svg)
+        self._render_job = self.after(delay, self._render_svg)
 
     def _render_svg(self) -> None:
         self._render_job = None
-        text = self._text_widget.get("1.0", "end-1c")
-        lines = text.splitlines()
-
-        svg = generate_lcd_svg(
-            rows=self.settings.rows,
-            cols=self.settings.cols,
-            lines=lines,
-            style=self.settings.style,
-            custom_chars=self.project.custom_chars,
+        # Only the visible rows are rendered, so don't copy the rest
+        rows = self.settings.rows
+        text = self._text_widget.get("1.0", f"{rows + 1}.0")
+        lines = tuple(text.splitlines()[:rows])
+        custom_key = tuple(
+            sorted(
+                (code, tuple(pattern))
+                for code, pattern in self.project.custom_chars.items()
+            )
         )
-
-        self._last_svg = svg
+        render_key = (self._settings_version, lines, custom_key)
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
+
+        # Unlike the version, the settings themselves match again when the
+        # user switches back, so they key the SVG cache
+        svg_key = (self.settings, lines, custom_key)
+        cached = _cache_get(self._svg_cache, svg_key)
+        if cached is None:
+            svg = generate_lcd_svg(
+                rows=self.settings.rows,
+                cols=self.settings.cols,
+                lines=lines,
+                style=self.settings.style,
+                custom_chars=self.project.custom_chars,
+            )
+            # Encode once; the bytes are hashed, rasterized and saved as is
+            svg_bytes = svg.encode("utf-8")
+            match = _VIEWBOX_RE.search(svg_bytes)
+            cached = (
+                svg_bytes,
+                hashlib.blake2b(svg_bytes, digest_size=16).hexdigest(),
+                (int(match[1]), int(match[2])) if match else (1, 1),
+            )
+            _cache_put(self._svg_cache, svg_key, cached)
+        self._last_svg_bytes, self._last_svg_hash, self._last_svg_size = cached
         self._update_preview()
 
     def _on_preview_resize(self, _event: Any = None) -> None:
-        if self._last_svg:
-            self._update_preview()
+        if not self._last_svg_bytes:
+            return
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(120, self._on_preview_resize_done)
+
+    def _on_preview_resize_done(self) -> None:
+        self._resize_job = None
+        self._update_preview()
 
     def _update_preview(self) -> None:
-        if not self._last_svg:
+        if not self._last_svg_bytes:
             return
         width = max(self.image_label.winfo_width(), 1)
         height = max(self.image_label.winfo_height(), 1)
+        preview_key = (self._last_svg_hash, width, height)
+        if preview_key == self._last_preview_key:
+            return
+        image = _cache_get(self._preview_cache, preview_key)
+        if image is not None:
+            self._show_preview(preview_key, image)
+            return
+        if self._raster_future is not None:
+            if self._raster_future_key == preview_key:
+                return
+            self._raster_future.cancel()
+
+        # Raster straight at the fitted size so no resample is needed
+        size = _fit_size(self._last_svg_size, width, height)
+        base = _cache_get(self._raster_cache, self._last_svg_hash)
+        if base is not None and base.width < size[0]:
+            base = None
+        self._raster_future = self._raster_pool.submit(
+            _rasterize_preview,
+            self._last_svg_bytes,
+            base,
+            size,
+        )
+        self._raster_future_key = preview_key
+        if self._raster_poll_job is None:
+            self._raster_poll_job = self.after(15, self._poll_raster_future)
+
+    def _poll_raster_future(self) -> None:
+        self._raster_poll_job = None
+        future = self._raster_future
+        if future is None:
+            return
+        if not future.done():
+            self._raster_poll_job = self.after(15, self._poll_raster_future)
+            return
+
+        preview_key = self._raster_future_key
+        self._raster_future = None
+        self._raster_future_key = None
         try:
-            png_bytes = cairosvg.svg2png(
-                bytestring=self._last_svg.encode("utf-8"),
-                output_width=width,
-            )
-            image = Image.open(io.BytesIO(png_bytes))
-            image = ImageOps.contain(
-                image,
-                (width, height),
-                method=Image.LANCZOS,
-            )
-            self._image_ref = ImageTk.PhotoImage(image)
-            self.image_label.configure(image=self._image_ref, text="")
+            base, image = future.result()
         except Exception as exc:  # noqa: BLE001
             self.image_label.configure(
                 text=(
@@ -790,206 +1184,347 @@ class LCDApp(ttk.Window):
                 ),
                 image="",
             )
+            self._last_preview_key = None
+            return
 
-    def _on_load_settings(self) -> None:
-        file_path = filedialog.askopenfilename(
-            title="Load Settings",
-            filetypes=[("LCD Settings", "*.lcd_settings")],
+        _cache_put(self._raster_cache, preview_key[0], base)
+        _cache_put(self._preview_cache, preview_key, image)
+        current_key = (
+            self._last_svg_hash,
+            max(self.image_label.winfo_width(), 1),
+            max(self.image_label.winfo_height(), 1),
         )
+        if preview_key != current_key:
+            # Content or size changed while rendering
+            self._update_preview()
+            return
+        self._show_preview(preview_key, image)
+
+    def _show_preview(
+        self, preview_key: tuple[str, int, int], image: Image.Image
+    ) -> None:
+        # Tk images must be created on the main thread
+        photo = self._image_ref
+        if (
+            photo is not None
+            and photo.width() == image.width
+            and photo.height() == image.height
+        ):
+            # Reuse the Tk image while the preview size stays the same
+            photo.paste(image)
+        else:
+            self._image_ref = ImageTk.PhotoImage(image)
+        self.image_label.configure(image=self._image_ref, text="")
+        self._last_preview_key = preview_key
+
+    def _on_load_settings(self) -> None:
+        file_path = self._file_dialogs["load_settings"].show()
         if not file_path:
             return
         try:
             self.settings = load_settings(file_path)
             self.project.settings = self.settings
             self._load_settings_into_ui()
-            self._schedule_render()
+            self._sync_preset_selection()
+            self._schedule_render(RENDER_DELAY_ACTION_MS)
         except OSError as exc:
             messagebox.showerror("Settings", f"Failed to load settings: {exc}")
 
     def _on_save_settings(self) -> None:
-        file_path = filedialog.asksaveasfilename(
-            title="Save Settings",
-            defaultextension=".lcd_settings",
-            filetypes=[("LCD Settings", "*.lcd_settings")],
-        )
+        file_path = self._file_dialogs["save_settings"].show()
         if not file_path:
             return
-        try:
-            save_settings(file_path, self.settings)
-        except OSError as exc:
-            messagebox.showerror("Settings", f"Failed to save settings: {exc}")
+        # Settings are frozen, so they need no snapshot
+        self._save_in_background(
+            "Settings",
+            "Failed to save settings",
+            save_settings,
+            file_path,
+            self.settings,
+        )
 
     def _load_settings_into_ui(self) -> None:
-        self.var_rows.set(self.settings.rows)
-        self.var_cols.set(self.settings.cols)
-        self.var_pixel_size.set(self.settings.style.pixel_size)
-        self.var_pixel_gap.set(self.settings.style.pixel_gap)
-        self.var_char_gap.set(self.settings.style.char_gap)
-        self.var_row_gap.set(self.settings.style.row_gap)
-        self.var_padding.set(self.settings.style.padding)
-        self.var_frame_width.set(self.settings.style.frame_width)
-        self.var_border_radius.set(self.settings.style.border_radius)
-        self.var_bg.set(self.settings.style.background)
-        self.var_frame.set(self.settings.style.frame)
-        self.var_pixel_on.set(self.settings.style.pixel_on)
-        self.var_pixel_off.set(self.settings.style.pixel_off)
+        # self.settings is already up to date, so the traces have nothing
+        # to do; skip them instead of rebuilding the settings 13 times
+        self._suppress_settings_trace = True
+        try:
+            self.var_rows.set(self.settings.rows)
+            self.var_cols.set(self.settings.cols)
+            self.var_pixel_size.set(self.settings.style.pixel_size)
+            self.var_pixel_gap.set(self.settings.style.pixel_gap)
+            self.var_char_gap.set(self.settings.style.char_gap)
+            self.var_row_gap.set(self.settings.style.row_gap)
+            self.var_padding.set(self.settings.style.padding)
+            self.var_frame_width.set(self.settings.style.frame_width)
+            self.var_border_radius.set(self.settings.style.border_radius)
+            self.var_bg.set(self.settings.style.background)
+            self.var_frame.set(self.settings.style.frame)
+            self.var_pixel_on.set(self.settings.style.pixel_on)
+            self.var_pixel_off.set(self.settings.style.pixel_off)
+        finally:
+            self._suppress_settings_trace = False
+        self._refresh_custom_char_grid_colors()
 
     def _on_load_project(self) -> None:
-        file_path = filedialog.askopenfilename(
-            title="Load Project",
-            filetypes=[("LCD Project", "*.lcd_project")],
-        )
+        file_path = self._file_dialogs["load_project"].show()
         if not file_path:
             return
         try:
             self.project = load_project(file_path)
             self.settings = self.project.settings
             self._load_settings_into_ui()
+            self._sync_preset_selection()
             self._refresh_input_selector()
             self._load_active_input_text()
-            self._schedule_render()
+            self._schedule_render(RENDER_DELAY_ACTION_MS)
         except OSError as exc:
             messagebox.showerror("Project", f"Failed to load project: {exc}")
 
     def _on_save_project(self) -> None:
-        file_path = filedialog.asksaveasfilename(
-            title="Save Project",
-            defaultextension=".lcd_project",
-            filetypes=[("LCD Project", "*.lcd_project")],
-        )
+        file_path = self._file_dialogs["save_project"].show()
         if not file_path:
             return
         self._update_active_input_text()
+        state = (
+            Path(file_path).with_suffix(".lcd_project"),
+            _project_fingerprint(self.project),
+        )
+        if state == self._saved_project_state and state[0].exists():
+            # Nothing changed since this file was last saved
+            return
+
+        def on_saved(_result: Any) -> None:
+            self._saved_project_state = state
+
+        # Snapshot the project so edits during the write can't race it
+        self._save_in_background(
+            "Project",
+            "Failed to save project",
+            save_project,
+            file_path,
+            copy.deepcopy(self.project),
+            on_saved=on_saved,
+        )
+
+    def _refresh_presets(self) -> None:
         try:
-            save_project(file_path, self.project)
-        except OSError as exc:
-            messagebox.showerror("Project", f"Failed to save project: {exc}")
+            mtime: Optional[int] = PRESETS_PATH.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        if self._presets_loaded and mtime == self._presets_mtime:
+            return
+        self._presets = self._load_presets()
+        self._preset_settings = [
+            self._preset_to_settings(preset) for preset in self._presets
+        ]
+        self._presets_mtime = mtime
+        self._presets_loaded = True
+
+    @staticmethod
+    def _preset_to_settings(preset: dict) -> Optional[LCDSettings]:
+        settings_data = preset.get("settings", {})
+        try:
+            return LCDSettings(
+                rows=int(settings_data.get("rows", 4)),
+                cols=int(settings_data.get("cols", 20)),
+                style=LCDStyle(**settings_data.get("style", {})),
+            )
+        except (TypeError, ValueError):
+            return None
 
     def _load_presets(self) -> list[dict[str, Any]]:
         if not PRESETS_PATH.exists():
-            return [
-                {
-                    "name": "Yellow LCD",
-                    "settings": {
-                        "rows": 4,
-                        "cols": 20,
-                        "style": {
-                            "background": "#d8f245",
-                            "frame": "#000000",
-                            "pixel_on": "#141f14",
-                            "pixel_off": "#cde543",
-                            "border_radius": 12,
-                            "padding": 16,
-                            "pixel_size": 3,
-                            "pixel_gap": 1,
-                            "char_gap": 4,
-                            "row_gap": 10,
-                            "frame_width": 8,
-                        },
-                    },
-                }
-            ]
+            # Only read, so the shared dicts need no copy
+            return list(_DEFAULT_PRESETS)
         try:
-            data = json.loads(PRESETS_PATH.read_text(encoding="utf-8"))
+            data = read_json(PRESETS_PATH)
             return list(data.get("presets", []))
         except (OSError, json.JSONDecodeError):
             return []
 
     def _refresh_input_selector(self) -> None:
-        names = [item.name for item in self.project.inputs]
+        names = self.project.input_names
         if not names:
-            names = ["Input 1"]
-            self.project.inputs = [LCDInput(name="Input 1", text="")]
+            names = self.project.input_names = ["Input 1"]
+            self.project.input_texts = [""]
             self.project.active_input = 0
-        self.input_selector["values"] = names
         active = min(self.project.active_input, len(names) - 1)
         self.project.active_input = active
+        state = (tuple(names), active)
+        if state == self._selector_state:
+            return
+        self._selector_state = state
+        self.input_selector["values"] = names
         self.input_selector.current(active)
 
     def _load_active_input_text(self) -> None:
-        if not self.project.inputs:
+        if not self.project.input_texts:
             return
-        text = self.project.inputs[self.project.active_input].text
+        text = self.project.input_texts[self.project.active_input]
+        current = self._text_widget.get("1.0", "end-1c")
         self._suppress_text_events = True
-        self._text_widget.delete("1.0", "end")
-        self._text_widget.insert("1.0", text)
+        if text != current:
+            if _has_astral(current) or _has_astral(text):
+                # Tk counts characters above U+FFFF as two, so code point
+                # offsets would be off; replace everything instead
+                prefix = suffix = 0
+                start, stop = "1.0", "end-1c"
+            else:
+                # Only replace the part between the common prefix and suffix
+                prefix, suffix = _changed_span(current, text)
+                start = f"1.0+{prefix}c"
+                stop = f"1.0+{len(current) - suffix}c"
+            end = len(text) - suffix
+            if len(current) - suffix > prefix:
+                self._text_widget.delete(start, stop)
+            if end - prefix > TEXT_INSERT_CHUNK:
+                # Long texts are inserted in chunks at a right-gravity mark,
+                # which moves past each chunk as it is inserted
+                self._text_widget.mark_set("input_load", start)
+                for i in range(prefix, end, TEXT_INSERT_CHUNK):
+                    chunk_end = min(i + TEXT_INSERT_CHUNK, end)
+                    self._text_widget.insert("input_load", text[i:chunk_end])
+                self._text_widget.mark_unset("input_load")
+            elif end > prefix:
+                self._text_widget.insert(start, text[prefix:end])
         self._text_widget.edit_modified(False)
         self._suppress_text_events = False
 
     def _update_active_input_text(self) -> None:
-        if self._suppress_text_events or not self.project.inputs:
+        if self._suppress_text_events or not self.project.input_texts:
             return
         text = self._text_widget.get("1.0", "end-1c")
-        self.project.inputs[self.project.active_input].text = text
+        self.project.input_texts[self.project.active_input] = text
 
     def _on_input_select(self, _event: Any = None) -> None:
         index = self.input_selector.current()
-        if index < 0:
+        # ttk re-fires the event when the same entry is picked again
+        if index < 0 or index == self.project.active_input:
             return
         self.project.active_input = index
+        if self._selector_state is not None:
+            # The combobox already shows the selection
+            self._selector_state = (self._selector_state[0], index)
         self._load_active_input_text()
-        self._schedule_render()
+        self._schedule_render(RENDER_DELAY_ACTION_MS)
 
     def _on_add_input(self) -> None:
-        new_index = len(self.project.inputs) + 1
-        self.project.inputs.append(
-            LCDInput(name=f"Input {new_index}", text="")
-        )
-        self.project.active_input = len(self.project.inputs) - 1
+        new_index = len(self.project.input_names) + 1
+        self.project.input_names.append(f"Input {new_index}")
+        self.project.input_texts.append("")
+        self.project.active_input = new_index - 1
         self._refresh_input_selector()
-        self._load_active_input_text()
-        self._schedule_render()
+        # The new input is empty, so clearing the widget is enough
+        if self._text_widget.compare("end-1c", "!=", "1.0"):
+            self._suppress_text_events = True
+            self._text_widget.delete("1.0", "end")
+            self._text_widget.edit_modified(False)
+            self._suppress_text_events = False
+        self._schedule_render(RENDER_DELAY_ACTION_MS)
 
     def _on_remove_input(self) -> None:
-        if len(self.project.inputs) <= 1:
+        if len(self.project.input_names) <= 1:
             return
         index = self.project.active_input
-        name = self.project.inputs[index].name
+        name = self.project.input_names[index]
         if not messagebox.askyesno(
             "Remove Input",
             f"Remove input '{name}'?",
             parent=self._get_dialog_parent(),
         ):
             return
-        self.project.inputs.pop(index)
+        self.project.input_names.pop(index)
+        self.project.input_texts.pop(index)
         self.project.active_input = max(0, index - 1)
         self._refresh_input_selector()
         self._load_active_input_text()
-        self._schedule_render()
+        self._schedule_render(RENDER_DELAY_ACTION_MS)
 
     def _on_rename_input(self) -> None:
-        if not self.project.inputs:
+        if not self.project.input_names or self._rename_entry is not None:
             return
         index = self.project.active_input
-        current_name = self.project.inputs[index].name
-        new_name = simpledialog.askstring(
-            "Rename Input",
-            "New name:",
-            initialvalue=current_name,
-            parent=self._get_dialog_parent(),
+        current_name = self.project.input_names[index]
+        # Edit in place over the selector instead of opening a modal dialog
+        entry = ttk.Entry(self.input_selector.master)
+        entry.insert(0, current_name)
+        entry.select_range(0, "end")
+        entry.place(
+            in_=self.input_selector, relx=0, rely=0, relwidth=1, relheight=1
         )
-        if not new_name:
+        entry.bind("<Return>", lambda _e: self._finish_rename(index, True))
+        entry.bind("<FocusOut>", lambda _e: self._finish_rename(index, True))
+        entry.bind("<Escape>", lambda _e: self._finish_rename(index, False))
+        entry.focus_set()
+        self._rename_entry = entry
+
+    def _finish_rename(self, index: int, commit: bool) -> None:
+        entry = self._rename_entry
+        if entry is None:
             return
-        self.project.inputs[index].name = new_name.strip() or current_name
-        self._refresh_input_selector()
+        self._rename_entry = None
+        new_name = entry.get().strip()
+        entry.destroy()
+        if not commit or not new_name:
+            return
+        names = self.project.input_names
+        if index < len(names) and new_name != names[index]:
+            names[index] = new_name
+            self._refresh_input_selector()
 
     def _on_save_svg(self) -> None:
-        file_path = filedialog.asksaveasfilename(
-            title="Save SVG",
-            defaultextension=".svg",
-            filetypes=[("SVG", "*.svg")],
-        )
+        file_path = self._file_dialogs["save_svg"].show()
         if not file_path:
             return
-        if not self._last_svg:
+        if not self._last_svg_bytes:
             self._render_svg()
-        if not self._last_svg:
+        if not self._last_svg_bytes:
             messagebox.showerror("SVG", "Nothing to save yet.")
             return
+        self._save_in_background(
+            "SVG",
+            "Failed to save SVG",
+            Path(file_path).write_bytes,
+            self._last_svg_bytes,
+        )
+
+    def _save_in_background(
+        self,
+        title: str,
+        error_message: str,
+        func: Callable[..., Any],
+        *args: Any,
+        on_saved: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        future = self._io_pool.submit(func, *args)
+        self.after(
+            15, self._poll_save_future, future, title, error_message, on_saved
+        )
+
+    def _poll_save_future(
+        self,
+        future: Future,
+        title: str,
+        error_message: str,
+        on_saved: Optional[Callable[[Any], None]],
+    ) -> None:
+        if not future.done():
+            self.after(
+                15,
+                self._poll_save_future,
+                future,
+                title,
+                error_message,
+                on_saved,
+            )
+            return
         try:
-            Path(file_path).write_text(self._last_svg, encoding="utf-8")
+            result = future.result()
         except OSError as exc:
-            messagebox.showerror("SVG", f"Failed to save SVG: {exc}")
+            messagebox.showerror(title, f"{error_message}: {exc}")
+            return
+        if on_saved is not None:
+            on_saved(result)
 
     def _get_dialog_parent(self) -> tk.Misc:
         if (